@@ -2,8 +2,30 @@ import pandas as pd
 import numpy as np
 import streamlit as st
 import os
+from concurrent.futures import ThreadPoolExecutor
+import pyarrow as pa
+import pyarrow.csv as pac
+import pyarrow.parquet as pq
 import plotly.express as px
-import plotly.graph_objects as go
+
+# Plotly rendering choices shared by every figure: lines go through WebGL
+# (scattergl) so they stay responsive as series grow, and bars skip their
+# per-bar outline pathing. There is no GL bar trace, so marker_line_width=0
+# is the equivalent lever for bar charts.
+LINE_RENDER_MODE = "webgl"
+
+
+def tune_bars(fig):
+    fig.update_traces(marker_line_width=0)
+    return fig
+
+
+# The only columns the dashboard touches; everything else is skipped at load.
+USED_COLUMNS = [
+    "order_id", "user_id", "product_name", "department", "aisle",
+    "reordered", "Day", "order_hour_of_day", "add_to_cart_order",
+    "order_number", "days_since_prior_order",
+]
 
 # -----------------------------
 # Page config
@@ -14,41 +36,250 @@ st.title("🛒 Instacart Dataset Dashboard")
 # -----------------------------
 # Load data
 # -----------------------------
+def optimize_dtypes(df):
+    """Shrink the frame: category codes for repeated strings, small ints for counters."""
+    for c in ["department", "aisle", "product_name", "Day"]:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+    # downcast="unsigned" picks the narrowest type that fits the actual
+    # values, so a bad row can't silently wrap the way a blind astype would.
+    for c in ["reordered", "order_hour_of_day", "add_to_cart_order", "order_number"]:
+        if c in df.columns:
+            df[c] = pd.to_numeric(df[c], downcast="unsigned")
+    if "days_since_prior_order" in df.columns:
+        df["days_since_prior_order"] = df["days_since_prior_order"].astype("float32")
+    return df
+
+
+# cache_resource returns the frame by reference instead of copying it out of
+# the cache on every access like cache_data would; nothing downstream mutates
+# it, and the Parquet file already covers cold starts across restarts.
+@st.cache_resource
 def load_data():
     data_folder = "data"
-    
+    parquet_cache = os.path.join(data_folder, "_cache.parquet")
+
     if not os.path.exists(data_folder):
         st.error(f"Data folder '{data_folder}' not found! Please ensure the data folder is in the repository root.")
         st.stop()
         return None
-    
+
+    # Parquet is columnar and compressed, so re-reading the cached copy on a
+    # cold start is several times faster than re-parsing the raw CSVs.
+    if os.path.exists(parquet_cache):
+        # Columnar projection: only read the columns the dashboard uses.
+        # The cache is written with the compact dtypes baked in, so
+        # optimize_dtypes() is a no-op here unless the file predates them.
+        available = pq.read_schema(parquet_cache).names
+        columns = [c for c in USED_COLUMNS if c in available]
+        return optimize_dtypes(pd.read_parquet(parquet_cache, engine="pyarrow", columns=columns))
+
     files = [f for f in os.listdir(data_folder) if f.endswith('.csv')]
     if not files:
         st.error(f"No CSV files found in '{data_folder}' folder.")
         st.stop()
         return None
-    
-    dfs = []
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
+
     try:
-        for i, f in enumerate(files):
-            status_text.text(f"Loading {f}... ({i+1}/{len(files)})")
-            file_path = os.path.join(data_folder, f)
-            dfs.append(pd.read_csv(file_path))
-            progress_bar.progress((i + 1) / len(files))
-        
-        status_text.text("Combining datasets...")
-        df = pd.concat(dfs, ignore_index=True)
-        progress_bar.empty()
-        status_text.empty()
+        # PyArrow parses each CSV with multiple C++ threads and the tables
+        # concatenate without copying, so this is much faster than looping
+        # over pd.read_csv and stacking the frames with pd.concat.
+        read_options = pac.ReadOptions(use_threads=True, block_size=64 << 20)
+
+        def read_one(f):
+            return pac.read_csv(os.path.join(data_folder, f), read_options=read_options)
+
+        # pac.read_csv releases the GIL, so a small thread pool overlaps disk
+        # I/O on one shard with parsing on another.
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as ex:
+            tables = list(ex.map(read_one, files))
+        # promote_options unifies shard schemas without copying; self_destruct
+        # frees each Arrow buffer as its block converts, so the CSV data is
+        # never held in memory twice during the pandas conversion.
+        table = pa.concat_tables(tables, promote_options="default")
+        del tables
+        table = table.select([c for c in USED_COLUMNS if c in table.column_names])
+        df = optimize_dtypes(table.to_pandas(split_blocks=True, self_destruct=True))
+        df.to_parquet(parquet_cache, engine="pyarrow", compression="snappy")
         return df
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         st.stop()
         return None
 
+def column_mask(df, col, selected):
+    """Membership mask computed on the integer category codes, not the strings."""
+    codes = df[col].cat.codes.to_numpy()
+    wanted = df[col].cat.categories.get_indexer(list(selected))
+    return np.isin(codes, wanted)
+
+
+def apply_filters(df, departments, aisles, products):
+    """Combine all active filters into one boolean mask and slice df once."""
+    mask = None
+    for col, selected in (
+        ("department", departments),
+        ("aisle", aisles),
+        ("product_name", products),
+    ):
+        if selected:
+            m = column_mask(df, col, selected)
+            mask = m if mask is None else mask & m
+    return df if mask is None else df[mask]
+
+
+@st.cache_data
+def compute_aggregations(departments, aisles, products):
+    """Run every chart aggregation once per filter state.
+
+    Reruns with unchanged filters (e.g. table widget changes) hit the cache
+    instead of re-running the groupbys over the full frame.
+    """
+    df = apply_filters(load_data(), departments, aisles, products)
+    # Options now come from the unfiltered frame, so cross-filter selections
+    # (e.g. a department plus an aisle outside it) can legitimately match
+    # nothing; signal that instead of aggregating an empty frame.
+    if len(df) == 0:
+        return None
+    aggs = {}
+    has_day = "Day" in df.columns
+    has_hour = "order_hour_of_day" in df.columns
+
+    if has_day and has_hour:
+        # Day has <=7 codes and hour <=24 values, so pack them into one small
+        # integer key and count the whole grid with a single O(N) bincount.
+        # The day-of-week and hour-of-day bars are the grid's margins, so
+        # three charts come out of this one scan.
+        day_cats = df["Day"].cat.categories
+        day_codes = df["Day"].cat.codes.to_numpy().astype(np.int64)
+        hours = df["order_hour_of_day"].to_numpy(np.int64)
+        valid = day_codes >= 0
+        grid = np.bincount(
+            day_codes[valid] * 24 + hours[valid], minlength=len(day_cats) * 24
+        ).reshape(len(day_cats), 24)
+
+        day_totals = grid.sum(axis=1)
+        hour_totals = grid.sum(axis=0)
+        aggs["dow_counts"] = pd.DataFrame(
+            {"Day": day_cats, "count": day_totals}
+        )[day_totals > 0].reset_index(drop=True)
+        aggs["hour_counts"] = pd.DataFrame(
+            {"order_hour_of_day": np.arange(24), "count": hour_totals}
+        )[hour_totals > 0].reset_index(drop=True)
+
+        day_hour_pivot = pd.DataFrame(grid, index=day_cats, columns=np.arange(24))
+        day_hour_pivot.index.name = "Day"
+        day_hour_pivot.columns.name = "order_hour_of_day"
+        aggs["day_hour_pivot"] = day_hour_pivot.loc[day_totals > 0]
+    else:
+        if has_day:
+            aggs["dow_counts"] = df.groupby("Day", observed=True).size().reset_index(name="count")
+        if has_hour:
+            aggs["hour_counts"] = df.groupby("order_hour_of_day", observed=True).size().reset_index(name="count")
+
+    # One full count over product_name feeds the bar chart and the heatmap
+    # seed; argpartition extracts the top 10 without sorting every product.
+    prod_cats = df["product_name"].cat.categories
+    prod_codes = df["product_name"].cat.codes.to_numpy()
+    prod_hist = np.bincount(prod_codes[prod_codes >= 0], minlength=len(prod_cats))
+    k = min(10, len(prod_hist))
+    top_idx = np.argpartition(-prod_hist, k - 1)[:k] if len(prod_hist) > k else np.arange(len(prod_hist))
+    top_idx = top_idx[np.argsort(-prod_hist[top_idx], kind="stable")]
+    aggs["top_products"] = pd.DataFrame(
+        {"Product Name": prod_cats[top_idx], "Count": prod_hist[top_idx]}
+    )
+
+    dept_cats = df["department"].cat.categories
+    dept_codes = df["department"].cat.codes.to_numpy()
+    dept_hist = np.bincount(dept_codes[dept_codes >= 0], minlength=len(dept_cats))
+    order = np.argsort(-dept_hist, kind="stable")
+    aggs["dept_counts"] = pd.DataFrame(
+        {"Department": dept_cats[order], "Count": dept_hist[order]}
+    )
+
+    # Top 10 products heatmap against the finest available axis
+    top_10_product_names = prod_cats[top_idx].tolist()
+    top_10_df = df[df["product_name"].isin(top_10_product_names)]
+    for axis in ["Day", "order_hour_of_day", "department"]:
+        if axis in df.columns:
+            heatmap_top_products = top_10_df.groupby(["product_name", axis], observed=True).size().reset_index(name="count")
+            heatmap_top_pivot = heatmap_top_products.pivot(index="product_name", columns=axis, values="count").fillna(0)
+            heatmap_top_pivot['total'] = heatmap_top_pivot.sum(axis=1)
+            heatmap_top_pivot = heatmap_top_pivot.sort_values('total', ascending=False).drop('total', axis=1)
+            aggs["top_heatmap_axis"] = axis
+            aggs["top_heatmap"] = heatmap_top_pivot
+            break
+
+    if "reordered" in df.columns:
+        # Straight numpy reduction on the uint8 array, skipping pandas'
+        # nullable-aware dispatch.
+        reordered = df["reordered"].to_numpy()
+        aggs["reorder_rate"] = reordered.mean() * 100
+
+        # reordered is 0/1, so per-department mean = weighted bincount over
+        # the department codes divided by the count histogram from above --
+        # one vectorized pass instead of a hash groupby.
+        dept_valid = dept_codes >= 0
+        reorder_sums = np.bincount(
+            dept_codes[dept_valid], weights=reordered[dept_valid], minlength=len(dept_cats)
+        )
+        observed = dept_hist > 0
+        rates = reorder_sums[observed] / dept_hist[observed]
+        aggs["reorder_by_dept"] = (
+            pd.DataFrame({"department": dept_cats[observed], "reordered": rates})
+            .sort_values("reordered", ascending=False)
+        )
+        # reordered is 0/1, so summing it per product counts reorders directly
+        # without materializing a filtered copy of the frame first.
+        aggs["top_reordered"] = (
+            df.groupby("product_name", observed=True)["reordered"].sum()
+            .nlargest(10)
+            .rename_axis("Product Name")
+            .reset_index(name="Reorder Count")
+        )
+
+    aggs["avg_order_per_customer"] = df['order_id'].nunique() / df['user_id'].nunique()
+
+    # value_counts sorts every user's count; argpartition pulls the top 10
+    # out of the histogram in O(n) and only sorts those.
+    uniq, inv = np.unique(df["user_id"].to_numpy(), return_inverse=True)
+    user_counts = np.bincount(inv)
+    k = min(10, len(user_counts))
+    idx = np.argpartition(-user_counts, k - 1)[:k] if len(user_counts) > k else np.arange(len(user_counts))
+    idx = idx[np.argsort(-user_counts[idx])]
+    aggs["top_users"] = pd.DataFrame({"User ID": uniq[idx], "Orders": user_counts[idx]})
+
+    return aggs
+
+
+@st.cache_data
+def filter_options():
+    """Sidebar option lists, built once from the raw frame.
+
+    The category index is already deduplicated and NaN-free, so this skips the
+    per-rerun dropna().unique() scans. Options always come from the unfiltered
+    frame, so earlier selections no longer silently shrink later option lists.
+    """
+    df = load_data()
+    return (
+        df["department"].cat.categories.tolist(),
+        df["aisle"].cat.categories.tolist(),
+        df["product_name"].cat.categories.tolist(),
+    )
+
+
+@st.cache_data
+def key_metrics():
+    """Unique-count scalars for the headline metrics, computed once per session."""
+    df = load_data()
+    return {
+        "orders": df["order_id"].nunique(),
+        "users": df["user_id"].nunique(),
+        "products": df["product_name"].nunique(),
+        "rows": int(df["product_name"].notna().sum()),
+    }
+
+
 with st.spinner("Loading data..."):
     df = load_data()
     if df is None:
@@ -60,11 +291,14 @@ with st.spinner("Loading data..."):
 st.header("📊 Key Metrics")
 col1, col2, col3, col4 = st.columns(4)
 
-col1.metric("Total Orders", f"{df['order_id'].nunique():,}")
-col2.metric("Total Users", f"{df['user_id'].nunique():,}")
-col3.metric("Unique Products", f"{df['product_name'].nunique():,}")
+metrics = key_metrics()
+col1.metric("Total Orders", f"{metrics['orders']:,}")
+col2.metric("Total Users", f"{metrics['users']:,}")
+col3.metric("Unique Products", f"{metrics['products']:,}")
 
-avg_products = df.groupby("order_id")["product_name"].count().mean()
+# Mean of per-order counts == total non-null products / unique orders,
+# which avoids building the whole groupby just to average it.
+avg_products = metrics["rows"] / metrics["orders"]
 col4.metric("Avg Products per Order", f"{avg_products:.2f}")
 
 st.markdown("---")
@@ -74,29 +308,35 @@ st.markdown("---")
 # -----------------------------
 st.sidebar.header("🔍 Filters")
 
+# session_state keeps the lists for the session without the per-rerun copy
+# st.cache_data makes when handing back its cached value (the product list
+# alone can hold tens of thousands of names).
+if "filter_options" not in st.session_state:
+    st.session_state["filter_options"] = filter_options()
+department_options, aisle_options, product_options = st.session_state["filter_options"]
+
 departments = st.sidebar.multiselect(
     "Select Department(s):",
-    options=df["department"].dropna().unique()
+    options=department_options
 )
-if departments:
-    df = df[df["department"].isin(departments)]
-
 aisles = st.sidebar.multiselect(
     "Select Aisle(s):",
-    options=df["aisle"].dropna().unique()
+    options=aisle_options
 )
-if aisles:
-    df = df[df["aisle"].isin(aisles)]
-
 products = st.sidebar.multiselect(
     "Select Product(s):",
-    options=df["product_name"].dropna().unique()
+    options=product_options
 )
-if products:
-    df = df[df["product_name"].isin(products)]
+
+df_view = apply_filters(df, departments, aisles, products)
 
 st.sidebar.markdown("Created by Bright Tavonga Bunhu")
 
+aggs = compute_aggregations(tuple(departments), tuple(aisles), tuple(products))
+if aggs is None:
+    st.warning("No rows match the selected filters. Adjust or clear them to see the charts.")
+    st.stop()
+
 # -----------------------------
 # Order Patterns
 # -----------------------------
@@ -104,23 +344,23 @@ st.header("🕒 Order Patterns")
 col1, col2 = st.columns(2)
 
 # Orders by day of week
-if "Day" in df.columns:
-    dow_counts = df.groupby("Day").size().reset_index(name="count")
+if "dow_counts" in aggs:
     fig_dow = px.bar(
-        dow_counts, x="Day", y="count",
+        aggs["dow_counts"], x="Day", y="count",
         title="Orders by Day of Week",
         labels={"Day": "Day of Week", "count": "Number of Orders"}
     )
-    col1.plotly_chart(fig_dow, width='stretch')
+    col1.plotly_chart(tune_bars(fig_dow), width='stretch')
 
 # Orders by hour of day
-if "order_hour_of_day" in df.columns:
-    hour_counts = df.groupby("order_hour_of_day").size().reset_index(name="count")
+if "hour_counts" in aggs:
     fig_hour = px.line(
-        hour_counts, x="order_hour_of_day", y="count",
+        aggs["hour_counts"], x="order_hour_of_day", y="count",
         title="Orders by Hour of Day",
-        labels={"order_hour_of_day": "Hour of Day", "count": "Number of Orders"}
+        labels={"order_hour_of_day": "Hour of Day", "count": "Number of Orders"},
+        render_mode=LINE_RENDER_MODE
     )
+    fig_hour.update_layout(hovermode="x")
     col2.plotly_chart(fig_hour, width='stretch')
 
 st.markdown("---")
@@ -132,17 +372,20 @@ st.header("🏬 Product & Department Insights")
 col1, col2 = st.columns(2)
 
 # Top 10 products
-top_products = df["product_name"].value_counts().head(10).reset_index()
-top_products.columns = ["Product Name", "Count"]
 fig_top = px.bar(
-    top_products, x="Count", y="Product Name",
+    aggs["top_products"], x="Count", y="Product Name",
     orientation="h", title="Top 10 Ordered Products"
 )
-col1.plotly_chart(fig_top, width='stretch')
-
-# Orders by department
-dept_counts = df["department"].value_counts().reset_index()
-dept_counts.columns = ["Department", "Count"]
+col1.plotly_chart(tune_bars(fig_top), width='stretch')
+
+# Orders by department (long tail folded into "Other" to cap slice count)
+dept_counts = aggs["dept_counts"]
+if len(dept_counts) > 9:
+    other_count = dept_counts["Count"].iloc[8:].sum()
+    dept_counts = pd.concat([
+        dept_counts.head(8),
+        pd.DataFrame([{"Department": "Other", "Count": other_count}]),
+    ], ignore_index=True)
 fig_dept = px.pie(
     dept_counts, names="Department", values="Count",
     title="Orders by Department"
@@ -151,66 +394,38 @@ col2.plotly_chart(fig_dept, width='stretch')
 
 # Top 10 Products Heatmap
 st.subheader("🔥 Top 10 Products Heatmap")
-top_10_product_names = df["product_name"].value_counts().head(10).index.tolist()
-top_10_df = df[df["product_name"].isin(top_10_product_names)]
-
-if "Day" in df.columns:
-    # Heatmap: Top 10 Products by Day of Week
-    heatmap_top_products = top_10_df.groupby(["product_name", "Day"]).size().reset_index(name="count")
-    heatmap_top_pivot = heatmap_top_products.pivot(index="product_name", columns="Day", values="count").fillna(0)
-    
-    # Sort products by total count (descending)
-    heatmap_top_pivot['total'] = heatmap_top_pivot.sum(axis=1)
-    heatmap_top_pivot = heatmap_top_pivot.sort_values('total', ascending=False).drop('total', axis=1)
-    
-    fig_top_heatmap = px.imshow(
-        heatmap_top_pivot,
-        labels=dict(x="Day of Week", y="Product", color="Number of Orders"),
-        title="Top 10 Products: Orders by Day of Week",
-        aspect="auto",
-        color_continuous_scale="YlOrRd",
-        text_auto=True
-    )
-    fig_top_heatmap.update_layout(height=500)
-    st.plotly_chart(fig_top_heatmap, width='stretch')
-elif "order_hour_of_day" in df.columns:
-    # Heatmap: Top 10 Products by Hour of Day
-    heatmap_top_products = top_10_df.groupby(["product_name", "order_hour_of_day"]).size().reset_index(name="count")
-    heatmap_top_pivot = heatmap_top_products.pivot(index="product_name", columns="order_hour_of_day", values="count").fillna(0)
-    
-    # Sort products by total count (descending)
-    heatmap_top_pivot['total'] = heatmap_top_pivot.sum(axis=1)
-    heatmap_top_pivot = heatmap_top_pivot.sort_values('total', ascending=False).drop('total', axis=1)
-    
-    fig_top_heatmap = px.imshow(
-        heatmap_top_pivot,
-        labels=dict(x="Hour of Day", y="Product", color="Number of Orders"),
-        title="Top 10 Products: Orders by Hour of Day",
-        aspect="auto",
-        color_continuous_scale="YlOrRd",
-        text_auto=True
-    )
-    fig_top_heatmap.update_layout(height=500)
-    st.plotly_chart(fig_top_heatmap, width='stretch')
-elif "department" in df.columns:
-    # Heatmap: Top 10 Products by Department
-    heatmap_top_products = top_10_df.groupby(["product_name", "department"]).size().reset_index(name="count")
-    heatmap_top_pivot = heatmap_top_products.pivot(index="product_name", columns="department", values="count").fillna(0)
-    
-    # Sort products by total count (descending)
-    heatmap_top_pivot['total'] = heatmap_top_pivot.sum(axis=1)
-    heatmap_top_pivot = heatmap_top_pivot.sort_values('total', ascending=False).drop('total', axis=1)
-    
-    fig_top_heatmap = px.imshow(
-        heatmap_top_pivot,
-        labels=dict(x="Department", y="Product", color="Number of Orders"),
-        title="Top 10 Products: Orders by Department",
-        aspect="auto",
-        color_continuous_scale="YlOrRd",
-        text_auto=True
-    )
-    fig_top_heatmap.update_layout(height=500)
-    st.plotly_chart(fig_top_heatmap, width='stretch')
+
+
+# Heatmaps are the heaviest figures on the page, so they are built lazily:
+# the figure is only constructed and serialized once its expander toggle is
+# on, and the fragment keeps the toggle from rerunning the rest of the page.
+@st.fragment
+def top_products_heatmap(aggs):
+    with st.expander("Top 10 Products Heatmap", expanded=False):
+        if not st.toggle("Render heatmap", key="show_top_heatmap"):
+            st.caption("Enable to render the heatmap.")
+            return
+        axis_labels = {
+            "Day": "Day of Week",
+            "order_hour_of_day": "Hour of Day",
+            "department": "Department",
+        }
+        axis_label = axis_labels[aggs["top_heatmap_axis"]]
+        fig_top_heatmap = px.imshow(
+            aggs["top_heatmap"],
+            labels=dict(x=axis_label, y="Product", color="Number of Orders"),
+            title=f"Top 10 Products: Orders by {axis_label}",
+            aspect="auto",
+            color_continuous_scale="YlOrRd",
+            # Per-cell text labels get unreadable and slow past a few hundred cells
+            text_auto=aggs["top_heatmap"].size <= 500
+        )
+        fig_top_heatmap.update_layout(height=500)
+        st.plotly_chart(fig_top_heatmap, width='stretch')
+
+
+if "top_heatmap" in aggs:
+    top_products_heatmap(aggs)
 
 st.markdown("---")
 
@@ -219,30 +434,25 @@ st.markdown("---")
 # -----------------------------
 st.header("🔁 Reordering Behavior")
 
-if "reordered" in df.columns:
-    reorder_rate = df["reordered"].mean() * 100
-    st.metric("Overall Reorder Rate", f"{reorder_rate:.2f}%")
+if "reorder_rate" in aggs:
+    st.metric("Overall Reorder Rate", f"{aggs['reorder_rate']:.2f}%")
 
-    reorder_by_dept = df.groupby("department")["reordered"].mean().reset_index()
-    reorder_by_dept = reorder_by_dept.sort_values("reordered", ascending=False)
     fig_reorder = px.bar(
-        reorder_by_dept,
+        aggs["reorder_by_dept"],
         x="department", y="reordered",
         title="Reorder Rate by Department",
         labels={"department": "Department", "reordered": "Reorder Rate"}
     )
-    st.plotly_chart(fig_reorder, width='stretch')
+    st.plotly_chart(tune_bars(fig_reorder), width='stretch')
 
     # -----------------------------
     # Top Reordered Products
     # -----------------------------
-    top_reordered = df[df["reordered"] == 1]["product_name"].value_counts().head(10).reset_index()
-    top_reordered.columns = ["Product Name", "Reorder Count"]
     fig_top_reordered = px.bar(
-        top_reordered, x="Reorder Count", y="Product Name",
+        aggs["top_reordered"], x="Reorder Count", y="Product Name",
         orientation="h", title="Top 10 Reordered Products"
     )
-    st.plotly_chart(fig_top_reordered, width='stretch')
+    st.plotly_chart(tune_bars(fig_top_reordered), width='stretch')
 
 st.markdown("---")
 
@@ -251,61 +461,72 @@ st.markdown("---")
 # -----------------------------
 st.header("👥 User Behavior Insights")
 
-avg_order_per_customer = df['order_id'].nunique() / df['user_id'].nunique()
-st.metric("Avg Orders Per Customer", f"{avg_order_per_customer:.2f}")
+st.metric("Avg Orders Per Customer", f"{aggs['avg_order_per_customer']:.2f}")
 
 # Busiest Users
-top_users = df["user_id"].value_counts().head(10).reset_index()
-top_users.columns = ["User ID", "Orders"]
 fig_top_users = px.bar(
-    top_users, x="Orders", y="User ID",
+    aggs["top_users"], x="Orders", y="User ID",
     orientation="h", title="Top 10 Busiest Users"
 )
-st.plotly_chart(fig_top_users, width='stretch')
+st.plotly_chart(tune_bars(fig_top_users), width='stretch')
 
 # Order Heatmap (Day vs Hour)
-if "Day" in df.columns and "order_hour_of_day" in df.columns:
-    heatmap_data = df.groupby(["Day", "order_hour_of_day"]).size().reset_index(name="count")
-    heatmap_pivot = heatmap_data.pivot(index="Day", columns="order_hour_of_day", values="count").fillna(0)
-    fig_heatmap = px.imshow(
-        heatmap_pivot, text_auto=True,
-        labels=dict(x="Hour of Day", y="Day", color="Number of Orders"),
-        title="Order Heatmap by Day & Hour"
-    )
-    st.plotly_chart(fig_heatmap, width='stretch')
+@st.fragment
+def day_hour_heatmap(aggs):
+    with st.expander("Order Heatmap by Day & Hour", expanded=False):
+        if not st.toggle("Render heatmap", key="show_day_hour_heatmap"):
+            st.caption("Enable to render the heatmap.")
+            return
+        fig_heatmap = px.imshow(
+            aggs["day_hour_pivot"], text_auto=True,
+            labels=dict(x="Hour of Day", y="Day", color="Number of Orders"),
+            title="Order Heatmap by Day & Hour"
+        )
+        st.plotly_chart(fig_heatmap, width='stretch')
+
+
+if "day_hour_pivot" in aggs:
+    day_hour_heatmap(aggs)
 
 # Orders table
 table_cols = [
     'user_id', 'order_id', 'add_to_cart_order', 'reordered', 'order_number',
     'days_since_prior_order', 'product_name', 'Day', 'order_hour_of_day'
 ]
-table_data = df[table_cols].astype(str)
-table_data = table_data.rename(columns={
-    'user_id': 'User ID',
-    'order_id': 'Order ID',
-    'add_to_cart_order': 'Add to Cart Order',
-    'reordered': 'Reordered',
-    'order_number': 'Order Number',
-    'days_since_prior_order': 'Days Since Prior Order',
-    'product_name': 'Product Name',
-    'Day': 'Day',
-    'order_hour_of_day': 'Order Hour',
-})
-
-st.title('Orders Table')
-num_rows = st.selectbox('Number of Rows', [10, 50, 100, 500, 1000, len(table_data)])
-display_from = st.selectbox('Display From', ['Top', 'Bottom'])
-
-table_data_display = table_data.head(num_rows) if display_from == 'Top' else table_data.tail(num_rows)
-
-fig_table = go.Figure(data=[go.Table(
-    header=dict(values=list(table_data_display.columns),
-                fill_color='#2f4f7f', align='left', font=dict(color='white')),
-    cells=dict(values=[table_data_display[col] for col in table_data_display.columns],
-               fill_color='black', align='left', font=dict(color='white'))
-)])
-fig_table.update_layout(title='Orders Table', paper_bgcolor='black')
-st.plotly_chart(fig_table, width='stretch')
+
+
+# As a fragment, changing the table widgets reruns only this block instead of
+# the whole script (and every chart above it).
+@st.fragment
+def orders_table(df_view):
+    st.title('Orders Table')
+    num_rows = st.selectbox('Number of Rows', [10, 50, 100, 500, 1000, len(df_view)])
+    display_from = st.selectbox('Display From', ['Top', 'Bottom'])
+
+    # Slice first and keep native dtypes: st.dataframe renders them directly,
+    # so no row ever needs the old object-dtype astype(str) copy.
+    table_data = df_view[table_cols]
+    table_data_display = (
+        table_data.head(num_rows) if display_from == 'Top' else table_data.tail(num_rows)
+    )
+    table_data_display = table_data_display.rename(columns={
+        'user_id': 'User ID',
+        'order_id': 'Order ID',
+        'add_to_cart_order': 'Add to Cart Order',
+        'reordered': 'Reordered',
+        'order_number': 'Order Number',
+        'days_since_prior_order': 'Days Since Prior Order',
+        'product_name': 'Product Name',
+        'Day': 'Day',
+        'order_hour_of_day': 'Order Hour',
+    })
+
+    # st.dataframe is virtualized, so only visible rows are rendered in the
+    # browser instead of serializing every cell into a Plotly figure.
+    st.dataframe(table_data_display, width='stretch', height=500, hide_index=True)
+
+
+orders_table(df_view)
 
 st.markdown("---")
 